@@ -1,11 +1,17 @@
-from typing import Any
+import weakref
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
 from cryptography.fernet import Fernet
 
-class BaseTransformer:
+_MISSING = object()
+
+class BaseTransformer(ABC):
     """A class for creating custom serializers and deserializers."""
-    def serizlize(self, data: dict) -> Any:
+    @abstractmethod
+    def serialize(self, data: dict) -> Any:
         ...
 
+    @abstractmethod
     def deserialize(self, data: Any) -> dict:
         ...
 
@@ -19,33 +25,24 @@ class EncryptedField:
     - The DEK and value are both encrypted with the Key Encryption Key (KEK), which is stored in the environment.
     - The mk_type and mk_version fields are for future-proofing when we need to roll the key.
     """
+    __slots__ = ('name', 'kek', 'dict_transformer', 'encrypted_name', '_kek_fernet', '_transformer', '_cache')
+
     def __init__(self, name: str, kek: str, transfomer: BaseTransformer | None):
         self.name = name
         self.kek = kek
         self.dict_transformer = transfomer
         self.encrypted_name = f"{name}_encrypted"
+        self._kek_fernet = Fernet(kek)
+        self._transformer = transfomer() if transfomer is not None else None
+
+        # Decrypted values per object, kept on the descriptor so plaintext never lands in the instance's __dict__
+        self._cache = weakref.WeakKeyDictionary()
 
     def __get__(self, obj, objtype=None):
         """Return the decrypted value of the field."""
         if obj is None:
             return self
-        encrypted_value = getattr(obj, self.encrypted_name)
-        if encrypted_value:
-            if self.dict_transformer:
-                dek = self.dict_transformer().deserialize(encrypted_value)['dek']
-            else:
-                dek = encrypted_value['dek']
-
-            decoded_dek = Fernet(self.kek).decrypt(dek.encode()).decode()
-
-            if self.dict_transformer:
-                values = self.dict_transformer().deserialize(encrypted_value)
-            else:
-                values = encrypted_value
-
-            return Fernet(decoded_dek).decrypt(values['value'].encode()).decode()
-
-        return None
+        return self._read(obj)
 
     def __set__(self, obj, value):
         """Encrypt the value and store it in the database."""
@@ -53,18 +50,77 @@ class EncryptedField:
         dek = Fernet.generate_key()
 
         # The data that will be set on the object
+        # NOTE: Both tokens are kept as str so the envelope stays JSON serializable and readable by existing rows
         encrypted_value = {
             'value': Fernet(dek).encrypt(value.encode()).decode(),
-            'dek': Fernet(self.kek).encrypt(dek).decode()
+            'dek': self._kek_fernet.encrypt(dek).decode()
         }
 
         # If there is a need to convert the dictionary into something else, call the serializer
-        if self.dict_transformer:
-            encrypted_value = self.dict_transformer().serialize(encrypted_value)
+        if self._transformer is not None:
+            encrypted_value = self._transformer.serialize(encrypted_value)
 
         # Store the new encrypted value as well as the encrypted DEK
         setattr(obj, self.encrypted_name, encrypted_value)
 
+    def decrypt_bulk(self, objs: Iterable[Any]) -> list[str | None]:
+        """
+        Decrypt this field on each of the given objects and prime their decryption cache.
+
+        This does the same work per object as reading the field in a loop; it is a convenience for warming the cache
+        up front (e.g. right after a query) and returning the decrypted values in order.
+
+        Usage:
+        users = session.query(User).all()
+        User.email.decrypt_bulk(users)  # Subsequent reads of user.email are served from the cache
+        """
+        return [self._read(obj) for obj in objs]
+
+    def _read(self, obj) -> str | None:
+        """Read the stored envelope from the object and return its decrypted value, or None if it is unset."""
+        # Loaded columns live in the instance dict; only fall back to the descriptor for unloaded ones
+        # (or for objects without an instance dict, e.g. classes using __slots__)
+        instance_dict = getattr(obj, '__dict__', None)
+        encrypted_value = instance_dict.get(self.encrypted_name, _MISSING) if instance_dict is not None else _MISSING
+        if encrypted_value is _MISSING:
+            encrypted_value = getattr(obj, self.encrypted_name)
+
+        # Empty column values ('' or {}) read back as unset, just like None
+        if not encrypted_value:
+            return None
+
+        return self._decrypt(obj, encrypted_value)
+
+    def _decrypt(self, obj, encrypted_value: Any) -> str:
+        """
+        Decrypt a stored value with its DEK.
+
+        The result is cached per object and reused for as long as the stored tokens are unchanged, so setting the
+        field or editing the envelope in place leads to a fresh decryption.
+        """
+        if self._transformer is not None:
+            values = self._transformer.deserialize(encrypted_value)
+        else:
+            values = encrypted_value
+
+        tokens = (values['dek'], values['value'])
+        try:
+            cached = self._cache.get(obj)
+        except TypeError:
+            # Objects that can't be hashed or weakly referenced are simply not cached
+            cached = obj = None
+
+        if cached is not None and cached[0] == tokens:
+            return cached[1]
+
+        decoded_dek = self._kek_fernet.decrypt(values['dek'])
+        value = Fernet(decoded_dek).decrypt(values['value']).decode()
+
+        if obj is not None:
+            self._cache[obj] = (tokens, value)
+
+        return value
+
 
 def _encrypt_fields(cls, kek: str, dict_transformer: Any | None = None):
     """
@@ -89,15 +145,11 @@ def _encrypt_fields(cls, kek: str, dict_transformer: Any | None = None):
     print(user.email)  # This will automatically be decrypted from "user_encrypted" and returned as a string
     """
 
-    fields = {}
-    for name, attr in cls.__dict__.items():
-        if name.endswith('_encrypted'):
-            base_name = name[:-10]  # Remove '_encrypted' suffix
-            fields[base_name] = EncryptedField(base_name, kek, dict_transformer)
-
-    # NOTE: We're running this loop again to avoid modifying the dictionary while iterating over it
-    for base_name, field in fields.items():
-        setattr(cls, base_name, field)
+    # NOTE: Iterate over a snapshot of the names since setattr adds entries to the class dictionary
+    for name in list(cls.__dict__):
+        base_name = name.removesuffix('_encrypted')
+        if base_name != name:
+            setattr(cls, base_name, EncryptedField(base_name, kek, dict_transformer))
 
     return cls
 
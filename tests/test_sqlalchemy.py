@@ -1,4 +1,5 @@
 import json
+import pickle
 import pytest
 from field_envelope_encrypt import encrypt_fields, BaseTransformer
 from typing import Any
@@ -79,7 +80,7 @@ class Transformer(BaseTransformer):
     def deserialize(self, data: Any) -> dict:
         return json.loads(data)
 
-@encrypt_fields(kek=test_kek, dict_transformer=Transformer)
+@encrypt_fields(kek=test_kek, transformer=Transformer)
 class UserModelWithTransform(Base):
     __tablename__ = "__users_str__"
 
@@ -88,6 +89,22 @@ class UserModelWithTransform(Base):
     email_encrypted: Mapped[dict] = mapped_column(Text)
     password_encrypted: Mapped[dict] = mapped_column(Text)
 
+@encrypt_fields(kek=test_kek)
+class SlottedUser:
+    """A plain (non-SQLAlchemy) class without an instance __dict__."""
+    __slots__ = ('email_encrypted',)
+
+    def __init__(self):
+        self.email_encrypted = None
+
+@encrypt_fields(kek=test_kek)
+class UnhashableUser:
+    """A plain class whose instances can't be hashed (defines __eq__ without __hash__)."""
+    email_encrypted = None
+
+    def __eq__(self, other):
+        return self is other
+
 class TestDecorator:
 
     def test_encrypted_fields(self, session):
@@ -179,3 +196,77 @@ class TestDecorator:
         # Make sure the encrypted fields are the same as the original encrypted fields
         assert user.email_encrypted['value'] == encrypted_email
         assert user.password_encrypted['value'] == encrypted_password
+
+    def test_decryption_cache(self, session):
+        """Make sure repeat reads reuse the decrypted value until the field is set again."""
+        user = UserModel()
+        user.email = 'test@code-a-lot.com'
+
+        # Repeat reads return the exact same cached string
+        first = user.email
+        assert user.email is first
+
+        # Setting the field replaces the encrypted value, so the cache is not reused
+        user.email = email = 'other@code-a-lot.com'
+        assert user.email == email
+
+        # Editing the envelope in place is picked up as well
+        other = UserModel()
+        other.email = other_email = 'another@code-a-lot.com'
+        user.email_encrypted.update(other.email_encrypted)
+        assert user.email == other_email
+
+        # The decrypted value is never stored on the instance itself
+        assert other_email not in vars(user).values()
+        assert other_email.encode() not in pickle.dumps(user)
+
+    def test_decrypt_bulk(self, session):
+        """Make sure a field can be decrypted for many rows at once."""
+        emails = ['one@code-a-lot.com', 'two@code-a-lot.com']
+        for email in emails:
+            user = UserModel()
+            user.name = 'Code Monkey'
+            user.email = email
+            user.password = 'password123'
+            session.add(user)
+        session.commit()
+
+        users = session.query(UserModel).order_by(UserModel.id).all()
+        decrypted = UserModel.email.decrypt_bulk(users)
+
+        assert decrypted[-2:] == emails
+
+        # The cache is primed, so reads return the bulk-decrypted values
+        for user, email in zip(users, decrypted):
+            assert user.email is email
+
+    def test_empty_encrypted_value(self, session):
+        """Make sure empty values in the encrypted columns read back as None."""
+        user = UserModel()
+        user.email_encrypted = {}
+        assert user.email is None
+
+        user = UserModelWithTransform()
+        user.email_encrypted = ''
+        assert user.email is None
+
+    def test_slotted_class(self):
+        """Make sure fields work on plain classes that use __slots__."""
+        user = SlottedUser()
+        assert user.email is None
+
+        user.email = email = 'test@code-a-lot.com'
+        assert user.email_encrypted != email
+        assert user.email == email
+
+        assert SlottedUser.email.decrypt_bulk([user, SlottedUser()]) == [email, None]
+
+    @pytest.mark.parametrize("user_class", [SlottedUser, UnhashableUser])
+    def test_uncached_objects(self, user_class):
+        """Make sure objects that can't be weakly referenced or hashed are decrypted on every read."""
+        user = user_class()
+        user.email = email = 'test@code-a-lot.com'
+
+        assert user.email == email
+        assert user.email == email
+        assert len(user_class.email._cache) == 0